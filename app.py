@@ -1,220 +1,28 @@
 import logging
 from flask import Flask, request, Response
-from xml.etree import ElementTree as ET
-from collections import deque
+
+from slpu_core import solve
 
 logger = logging.getLogger(__name__)
 app = Flask(__name__)
 
-SQUARE_SIZE = 32
-
-def parse_svg_board(svg_xml):
-    tree = ET.fromstring(svg_xml)
-    view_box = tree.attrib.get('viewBox')
-    if view_box:
-        _, _, width_px, height_px = map(float, view_box.split())
-    else:
-        width_px = float(tree.attrib.get('width', SQUARE_SIZE*16))
-        height_px = float(tree.attrib.get('height', SQUARE_SIZE*16))
-    
-    width_squares = round(width_px / SQUARE_SIZE)
-    height_squares = round(height_px / SQUARE_SIZE)
-    total_squares = width_squares * height_squares
-    
-    jumps = {}
-    for elem in tree.iter():
-        if elem.tag.endswith('line'):
-            # Accept all colored lines, not just green/red
-            stroke = elem.attrib.get('stroke', '').strip()
-            if stroke and stroke.lower() != 'none':
-                try:
-                    x1, y1 = float(elem.attrib['x1']), float(elem.attrib['y1'])
-                    x2, y2 = float(elem.attrib['x2']), float(elem.attrib['y2'])
-                    start_sq = coord_to_square(x1, y1, width_squares, height_squares)
-                    end_sq = coord_to_square(x2, y2, width_squares, height_squares)
-                    
-                    if start_sq and end_sq and start_sq != end_sq:
-                        jumps[start_sq] = end_sq
-                        print(f"Jump from {start_sq} to {end_sq} with color {stroke}")
-                except (ValueError, KeyError):
-                    continue
-    
-    return width_squares, height_squares, total_squares, jumps
-
-def coord_to_square(x, y, width, height):
-    """Convert (x, y) in pixels to 1-based square ID using boustrophedon pattern."""
-    if x < 0 or y < 0:
-        return None
-    
-    col = int(x // SQUARE_SIZE)
-    row_from_top = int(y // SQUARE_SIZE)
-    row = height - 1 - row_from_top  # Convert to bottom-up indexing
-    
-    if row < 0 or col < 0 or row >= height or col >= width:
-        return None
-    
-    # Boustrophedon pattern: even rows go left-to-right, odd rows go right-to-left
-    if row % 2 == 0:
-        square = row * width + col + 1
-    else:
-        square = row * width + (width - 1 - col) + 1
-    
-    return square
-
-def simulate_move(pos, face, dice_type, total_squares, jumps):
-    """Simulate a single move and return new position and dice type."""
-    if dice_type == 0:  # Regular die
-        move = face
-        next_dice = 1 if face == 6 else 0  # Power up on rolling 6
-    else:  # Power-of-two die
-        move = 2 ** face  # 2^1=2, 2^2=4, 2^3=8, 2^4=16, 2^5=32, 2^6=64
-        next_dice = 0 if face == 1 else 1  # Revert on rolling 1
-    
-    next_pos = pos + move
-    
-    # Handle overshooting
-    if next_pos > total_squares:
-        next_pos = total_squares - (next_pos - total_squares)
-    
-    # Handle jumps (snakes and ladders)
-    if next_pos in jumps:
-        next_pos = jumps[next_pos]
-    
-    return next_pos, next_dice
-
-def find_winning_solution(total_squares, jumps):
-    """Find a solution that wins the game, prioritizing coverage."""
-    
-    # First, try to find any winning solution using BFS
-    queue = deque()
-    queue.append((0, 0, [], set([0])))  # pos, dice_type, rolls, visited_squares
-    visited_states = set()
-    visited_states.add((0, 0))
-    
-    best_solution = None
-    best_coverage = 0
-    
-    max_iterations = 100000
-    iterations = 0
-    
-    while queue and iterations < max_iterations:
-        iterations += 1
-        pos, dice_type, rolls, visited_squares = queue.popleft()
-        
-        # Check if we've won
-        if pos == total_squares:
-            coverage = len(visited_squares) / total_squares
-            if coverage > best_coverage:
-                best_coverage = coverage
-                best_solution = rolls.copy()
-            continue
-        
-        # Don't explore paths that are too long
-        if len(rolls) > 1000:
-            continue
-        
-        # Try all possible dice faces
-        for face in range(1, 7):
-            next_pos, next_dice = simulate_move(pos, face, dice_type, total_squares, jumps)
-            new_visited = visited_squares | {next_pos}
-            
-            state = (next_pos, next_dice)
-            if state not in visited_states or len(new_visited) > len(visited_squares):
-                visited_states.add(state)
-                queue.append((next_pos, next_dice, rolls + [face], new_visited))
-    
-    # If we found a solution, return it
-    if best_solution:
-        return best_solution
-    
-    # Fallback: try a simple greedy approach
-    pos, dice_type = 0, 0
-    rolls = []
-    visited = set([0])
-    
-    for _ in range(1000):  # Prevent infinite loops
-        if pos == total_squares:
-            break
-            
-        best_face = 1
-        best_next_pos = 0
-        best_progress = -1
-        
-        # Try each possible face and pick the best one
-        for face in range(1, 7):
-            next_pos, _ = simulate_move(pos, face, dice_type, total_squares, jumps)
-            
-            # Prefer moves that get us closer to the end or to new squares
-            progress = next_pos if next_pos not in visited else next_pos * 0.5
-            if next_pos == total_squares:
-                progress += 1000  # Strongly prefer winning moves
-            
-            if progress > best_progress:
-                best_progress = progress
-                best_face = face
-                best_next_pos = next_pos
-        
-        rolls.append(best_face)
-        pos, dice_type = simulate_move(pos, best_face, dice_type, total_squares, jumps)
-        visited.add(pos)
-    
-    return rolls if rolls else [1]
+SVG_PREFIX = b'<svg xmlns="http://www.w3.org/2000/svg"><text>'
+SVG_SUFFIX = b'</text></svg>'
 
 @app.route('/', methods=['GET'])
 def home():
     return 'Snakes and Ladders Power Up API Running'
 
-def test_solution(rolls, total_squares, jumps):
-    """Test if a sequence of rolls actually wins the game."""
-    pos, dice_type = 0, 0
-    print(f"Testing solution: {rolls}")
-    
-    for i, face in enumerate(rolls):
-        old_pos = pos
-        pos, dice_type = simulate_move(pos, face, dice_type, total_squares, jumps)
-        die_type_name = "power" if dice_type == 1 else "regular"
-        print(f"Roll {i+1}: {face} -> {old_pos} to {pos} (next die: {die_type_name})")
-        
-        if pos == total_squares:
-            print(f"Won the game in {i+1} moves!")
-            return True
-        
-        if i > 500:  # Safety break
-            print("Too many moves, stopping test")
-            break
-    
-    print(f"Did not win. Final position: {pos}")
-    return False
-
 @app.route('/slpu', methods=['POST'])
 def slpu():
     try:
-        svg_xml = request.data.decode('utf-8')
-        print(f"Received SVG with length: {len(svg_xml)}")
-        
-        width, height, total_squares, jumps = parse_svg_board(svg_xml)
-        print(f"Board: {width}x{height} = {total_squares} squares")
-        print(f"Found {len(jumps)} jumps: {jumps}")
-        
-        rolls = find_winning_solution(total_squares, jumps)
-        
-        # Test the solution before returning it
-        if not test_solution(rolls, total_squares, jumps):
-            print("Solution failed test, using fallback")
-            rolls = [6, 6, 6, 6, 6, 1]  # Simple fallback
-        
-        roll_text = "".join(str(r) for r in rolls)
-        print(f"Final solution: {roll_text} ({len(rolls)} moves)")
-        
-        out_svg = f'<svg xmlns="http://www.w3.org/2000/svg"><text>{roll_text}</text></svg>'
+        out_svg = SVG_PREFIX + solve(request.data) + SVG_SUFFIX
         return Response(out_svg, mimetype='image/svg+xml')
     
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Failed to solve board")
         # Return a minimal fallback solution
-        out_svg = '<svg xmlns="http://www.w3.org/2000/svg"><text>666661</text></svg>'
+        out_svg = SVG_PREFIX + b'666661' + SVG_SUFFIX
         return Response(out_svg, mimetype='image/svg+xml')
 
 if __name__ == "__main__":
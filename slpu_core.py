@@ -0,0 +1,265 @@
+import hashlib
+import io
+import logging
+import math
+import threading
+from collections import OrderedDict
+from xml.etree import ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+SQUARE_SIZE = 32
+# Caps the work one request can cause; the solver allocates per-square tables
+MAX_SQUARES = 250_000
+SOLUTION_CACHE_SIZE = 1024
+SVG_TAGS = frozenset(('svg', '{http://www.w3.org/2000/svg}svg'))
+LINE_TAGS = frozenset(('line', '{http://www.w3.org/2000/svg}line'))
+NO_STROKE = frozenset(('', 'none'))
+
+# 2 ** face for each power-die face, indexed by face (index 0 is unused)
+POW2 = (0, 2, 4, 8, 16, 32, 64)
+
+# Per-(dice_type, face - 1) move distance and next die type
+MOVE = ((1, 2, 3, 4, 5, 6), POW2[1:])
+NEXT_DICE = ((0, 0, 0, 0, 0, 1), (0, 1, 1, 1, 1, 1))
+
+# Per next die type, every (dice_type, face - 1, move) roll that leads to it
+REVERSE_MOVES = tuple(
+    tuple((dice_type, face_idx, MOVE[dice_type][face_idx])
+          for dice_type in (0, 1) for face_idx in range(6)
+          if NEXT_DICE[dice_type][face_idx] == next_dice)
+    for next_dice in (0, 1)
+)
+
+# Roll digits of boards already solved, keyed by BLAKE2b digest of the SVG,
+# least recently used first
+_solution_cache = OrderedDict()
+_solution_cache_lock = threading.Lock()
+
+def parse_svg_board(svg_data):
+    # Stream the document and clear each element once it has been handled.
+    # Cleared elements stay attached to their parent until it is cleared in
+    # turn, so only empty shells of the root's direct children pile up
+    width_px = height_px = SQUARE_SIZE*16
+    # Gather every line's endpoints first, then map them to squares in one pass
+    xs, ys, strokes = [], [], []
+    for _, elem in ET.iterparse(io.BytesIO(svg_data)):
+        tag = elem.tag
+        # Match <line> in no namespace or the SVG one cheaply, any other by suffix
+        if tag in LINE_TAGS or tag.endswith('}line'):
+            attrib = elem.attrib
+            # Accept all colored lines, not just green/red
+            stroke = attrib.get('stroke', '').strip()
+            if stroke.lower() not in NO_STROKE:
+                try:
+                    x1, y1 = float(attrib['x1']), float(attrib['y1'])
+                    x2, y2 = float(attrib['x2']), float(attrib['y2'])
+                except (ValueError, KeyError):
+                    pass
+                else:
+                    xs += (x1, x2)
+                    ys += (y1, y2)
+                    strokes.append(stroke)
+        elif tag in SVG_TAGS:
+            # Read the size before clearing; the root ends last, so its size wins
+            attrib = elem.attrib
+            view_box = attrib.get('viewBox')
+            if view_box:
+                parts = view_box.split()
+                width_px, height_px = parts[2], parts[3]
+            else:
+                width_px = attrib.get('width', SQUARE_SIZE*16)
+                height_px = attrib.get('height', SQUARE_SIZE*16)
+        elem.clear()
+    
+    width_squares = px_to_squares(width_px)
+    height_squares = px_to_squares(height_px)
+    total_squares = width_squares * height_squares
+    if not 0 <= total_squares <= MAX_SQUARES:
+        raise ValueError(f"Board of {total_squares} squares is outside the supported size")
+    
+    squares = coords_to_squares(xs, ys, width_squares, height_squares)
+    jumps = {}
+    for start_sq, end_sq, stroke in zip(squares[0::2], squares[1::2], strokes):
+        if start_sq and end_sq and start_sq != end_sq:
+            jumps[start_sq] = end_sq
+            logger.debug("Jump from %s to %s with color %s", start_sq, end_sq, stroke)
+    
+    return width_squares, height_squares, total_squares, jumps
+
+def px_to_squares(px):
+    """Round a board length in pixels to a whole number of squares."""
+    try:
+        # Boards are drawn on whole pixels, so skip the float round-trip
+        return (int(px) + SQUARE_SIZE // 2) // SQUARE_SIZE
+    except ValueError:
+        # Round half up here too, so "400" and "400.0" give the same board
+        return int(float(px) / SQUARE_SIZE + 0.5)
+
+def coords_to_squares(xs, ys, width, height):
+    """Convert parallel lists of x and y pixels to 1-based square IDs using boustrophedon pattern."""
+    squares = []
+    append = squares.append
+    for x, y in zip(xs, ys):
+        # Negative, NaN and infinite coordinates are off the board
+        if not (0 <= x < math.inf and 0 <= y < math.inf):
+            append(None)
+            continue
+        
+        col = int(x // SQUARE_SIZE)
+        row = height - 1 - int(y // SQUARE_SIZE)  # Convert to bottom-up indexing
+        
+        if row < 0 or col >= width:
+            append(None)
+        # Boustrophedon pattern: even rows go left-to-right, odd rows go right-to-left
+        elif row % 2 == 0:
+            append(row * width + col + 1)
+        else:
+            append(row * width + (width - 1 - col) + 1)
+    
+    return squares
+
+def reconstruct_rolls(parent_state, parent_face, state):
+    """Walk parent pointers back from state to the start and return the rolls."""
+    rolls = []
+    while state:
+        rolls.append(parent_face[state])
+        state = parent_state[state]
+    rolls.reverse()
+    return rolls
+
+def join_rolls(parent_state, parent_face, child_state, child_face, meet, total_squares):
+    """Return the rolls from the start to meet followed by those from meet to the goal."""
+    rolls = reconstruct_rolls(parent_state, parent_face, meet)
+    state = meet
+    while state >> 1 != total_squares:
+        rolls.append(child_face[state])
+        state = child_state[state]
+    return rolls
+
+def find_winning_solution(total_squares, jumps):
+    """Find the shortest sequence of rolls that wins the game."""
+    
+    # Dense jump table: jump_to[square] is where landing on square ends up,
+    # and jump_from[square] lists the jump sources that end up on square
+    jump_to = list(range(total_squares + 1))
+    jump_from = {}
+    for src, dst in jumps.items():
+        jump_to[src] = dst
+        jump_from.setdefault(dst, []).append(src)
+    
+    # States are encoded as pos * 2 + dice_type; the start state (0, 0) is 0.
+    # Search forward from the start and backward from both winning states,
+    # one whole level at a time, until the two searches meet
+    num_states = 2 * (total_squares + 1)
+    goal = 2 * total_squares
+    fwd_visited = bytearray(num_states)
+    bwd_visited = bytearray(num_states)
+    parent_state = [0] * num_states  # Previous state on the way from the start
+    parent_face = [0] * num_states
+    child_state = [0] * num_states  # Next state on the way to the goal
+    child_face = [0] * num_states
+    fwd_visited[0] = 1
+    bwd_visited[goal] = bwd_visited[goal + 1] = 1
+    
+    # Every state is enqueued at most once per direction, so each frontier
+    # fits in a preallocated list
+    fwd_frontier = [0] * num_states
+    fwd_head, fwd_tail = 0, 1
+    bwd_frontier = [0] * num_states
+    bwd_frontier[0], bwd_frontier[1] = goal, goal + 1
+    bwd_head, bwd_tail = 0, 2
+    
+    # Both sides are expanded a whole level at a time, so the first state
+    # they share already lies on a shortest path
+    while fwd_head < fwd_tail and bwd_head < bwd_tail:
+        # Expand whichever frontier is smaller
+        if fwd_tail - fwd_head <= bwd_tail - bwd_head:
+            level_end = fwd_tail
+            while fwd_head < level_end:
+                state = fwd_frontier[fwd_head]
+                fwd_head += 1
+                pos, dice_type = state >> 1, state & 1
+                
+                # Try all possible dice faces
+                moves = MOVE[dice_type]
+                next_dices = NEXT_DICE[dice_type]
+                for face_idx in range(6):
+                    next_pos = pos + moves[face_idx]
+                    if next_pos > total_squares:
+                        next_pos = total_squares - (next_pos - total_squares)
+                        if next_pos < 0:  # Bounced off the board entirely
+                            continue
+                    next_pos = jump_to[next_pos]
+                    
+                    next_state = next_pos * 2 + next_dices[face_idx]
+                    if not fwd_visited[next_state]:
+                        fwd_visited[next_state] = 1
+                        parent_state[next_state] = state
+                        parent_face[next_state] = face_idx + 1
+                        if bwd_visited[next_state]:
+                            return join_rolls(parent_state, parent_face, child_state,
+                                              child_face, next_state, total_squares)
+                        fwd_frontier[fwd_tail] = next_state
+                        fwd_tail += 1
+        else:
+            level_end = bwd_tail
+            while bwd_head < level_end:
+                state = bwd_frontier[bwd_head]
+                bwd_head += 1
+                pos, dice_type = state >> 1, state & 1
+                
+                # Squares a move can land on to end up on pos
+                landings = jump_from.get(pos, ())
+                if jump_to[pos] == pos:
+                    landings = (pos, *landings)
+                
+                # Undo every (die, face) whose roll leaves dice_type next
+                for prev_dice, face_idx, move in REVERSE_MOVES[dice_type]:
+                    for landing in landings:
+                        # Either a direct move, or an overshoot that bounced back
+                        prev_positions = (landing - move,)
+                        if landing < total_squares:
+                            prev_positions += (2 * total_squares - landing - move,)
+                        for prev_pos in prev_positions:
+                            if prev_pos < 0 or prev_pos >= total_squares:
+                                continue
+                            # Nobody can stand on a jump source that isn't also a target
+                            if jump_to[prev_pos] != prev_pos and prev_pos not in jump_from:
+                                continue
+                            
+                            prev_state = prev_pos * 2 + prev_dice
+                            if not bwd_visited[prev_state]:
+                                bwd_visited[prev_state] = 1
+                                child_state[prev_state] = state
+                                child_face[prev_state] = face_idx + 1
+                                if fwd_visited[prev_state]:
+                                    return join_rolls(parent_state, parent_face, child_state,
+                                                      child_face, prev_state, total_squares)
+                                bwd_frontier[bwd_tail] = prev_state
+                                bwd_tail += 1
+    
+    raise ValueError("No sequence of rolls reaches the last square")
+
+def solve(svg_data):
+    """Return the winning roll digits for raw SVG bytes, memoized by content hash."""
+    key = hashlib.blake2b(svg_data, digest_size=16).digest()
+    with _solution_cache_lock:
+        roll_digits = _solution_cache.get(key)
+        if roll_digits is not None:
+            _solution_cache.move_to_end(key)
+            return roll_digits
+    
+    width, height, total_squares, jumps = parse_svg_board(svg_data)
+    logger.debug("Board: %dx%d = %d squares", width, height, total_squares)
+    logger.debug("Found %d jumps: %s", len(jumps), jumps)
+    
+    rolls = find_winning_solution(total_squares, jumps)
+    roll_digits = bytes(r + 48 for r in rolls)  # 48 is ord('0')
+    
+    # Evict the least recently used entry once the cache is full
+    with _solution_cache_lock:
+        if key not in _solution_cache and len(_solution_cache) >= SOLUTION_CACHE_SIZE:
+            _solution_cache.popitem(last=False)
+        _solution_cache[key] = roll_digits
+    return roll_digits
@@ -0,0 +1,116 @@
+import random
+from collections import deque
+
+import pytest
+
+from slpu_core import MAX_SQUARES, find_winning_solution, parse_svg_board, px_to_squares, solve
+
+
+def step(pos, dice_type, face, total_squares, jumps):
+    """Apply one roll; return None if it bounces off the board entirely."""
+    # Spelled out here rather than taken from slpu_core, so a wrong table fails
+    if dice_type == 0:  # Regular die, powers up on a 6
+        move = face
+        next_dice = 1 if face == 6 else 0
+    else:  # Power-of-two die, reverts on a 1
+        move = 2 ** face
+        next_dice = 0 if face == 1 else 1
+
+    next_pos = pos + move
+    if next_pos > total_squares:
+        next_pos = total_squares - (next_pos - total_squares)
+        if next_pos < 0:
+            return None
+    return jumps.get(next_pos, next_pos), next_dice
+
+
+def shortest_win(total_squares, jumps):
+    """Plain forward BFS; return the length of the shortest win, or None."""
+    dist = {(0, 0): 0}
+    queue = deque([(0, 0)])
+    while queue:
+        pos, dice_type = state = queue.popleft()
+        if pos == total_squares:
+            return dist[state]
+        for face in range(1, 7):
+            next_state = step(pos, dice_type, face, total_squares, jumps)
+            if next_state is not None and next_state not in dist:
+                dist[next_state] = dist[state] + 1
+                queue.append(next_state)
+    return None
+
+
+def random_board(rng):
+    total_squares = rng.randint(1, 200)
+    jumps = {}
+    for _ in range(rng.randint(0, total_squares // 2)):
+        src, dst = rng.randint(1, total_squares), rng.randint(1, total_squares)
+        if src != dst:
+            jumps[src] = dst
+    return total_squares, jumps
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_find_winning_solution_matches_forward_bfs(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        total_squares, jumps = random_board(rng)
+        expected = shortest_win(total_squares, jumps)
+        if expected is None:
+            with pytest.raises(ValueError):
+                find_winning_solution(total_squares, jumps)
+            continue
+
+        rolls = find_winning_solution(total_squares, jumps)
+        assert len(rolls) == expected
+
+        state = (0, 0)
+        for face in rolls:
+            assert state[0] != total_squares
+            state = step(state[0], state[1], face, total_squares, jumps)
+            assert state is not None
+        assert state[0] == total_squares
+
+
+def test_find_winning_solution_unreachable_goal():
+    # Landing on the last square always sends the player back to square 1
+    with pytest.raises(ValueError):
+        find_winning_solution(100, {100: 1})
+
+
+def test_parse_svg_board_uses_root_size_over_nested_svg():
+    svg = (b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 320 96">'
+           b'<svg width="64" height="64"/></svg>')
+    assert parse_svg_board(svg) == (10, 3, 30, {})
+
+
+def test_parse_svg_board_rejects_oversized_board():
+    side = 32 * (int(MAX_SQUARES ** 0.5) + 1)
+    svg = b'<svg width="%d" height="%d"/>' % (side, side)
+    with pytest.raises(ValueError):
+        parse_svg_board(svg)
+    with pytest.raises(ValueError):
+        solve(svg)
+
+
+def test_parse_svg_board_skips_non_finite_coordinates():
+    svg = (b'<svg xmlns="http://www.w3.org/2000/svg" width="512" height="512">'
+           b'<line x1="NaN" y1="16" x2="16" y2="16" stroke="red"/>'
+           b'<line x1="16" y1="inf" x2="16" y2="16" stroke="red"/>'
+           b'<line x1="16" y1="496" x2="16" y2="16" stroke="green"/>'
+           b'</svg>')
+    assert parse_svg_board(svg) == (16, 16, 256, {1: 256})
+
+
+def test_parse_svg_board_accepts_lines_in_any_namespace():
+    svg = (b'<svg xmlns="http://www.w3.org/2000/svg" xmlns:x="urn:x" width="512" height="512">'
+           b'<x:line x1="16" y1="496" x2="16" y2="16" stroke="green"/>'
+           b'</svg>')
+    assert parse_svg_board(svg)[3] == {1: 256}
+
+
+@pytest.mark.parametrize('px, squares', [
+    ('400', 13), ('400.0', 13), ('399.9', 12), ('512', 16), ('511.6', 16), (512, 16),
+])
+def test_px_to_squares_rounds_half_up(px, squares):
+    assert px_to_squares(px) == squares